@@ -96,6 +96,16 @@ class SinhArcsinh(bijector.Bijector):
       self._tailweight = tensor_util.convert_nonref_to_tensor(
           tailweight, dtype=dtype, name="tailweight")
       self._scale_number = tf.convert_to_tensor(2., dtype=dtype)
+      # When `tailweight` is a Python or NumPy literal, no gradient tape can
+      # ever watch it, so the output multiplier `2 / F_0(2)` is a true
+      # constant; compute it once here rather than re-evaluating two
+      # transcendental ops on every call to `forward`/`inverse`. Tensor and
+      # ref (e.g. `tf.Variable`) tailweights keep the per-call computation so
+      # gradients flow through the multiplier term.
+      self._cached_multiplier = None
+      if not (tf.is_tensor(tailweight) or tensor_util.is_ref(tailweight)):
+        self._cached_multiplier = self._output_multiplier(
+            tf.convert_to_tensor(self._tailweight))
       super(SinhArcsinh, self).__init__(
           forward_min_event_ndims=0,
           validate_args=validate_args,
@@ -121,6 +131,8 @@ class SinhArcsinh(bijector.Bijector):
     return self._tailweight
 
   def _output_multiplier(self, tailweight):
+    if self._cached_multiplier is not None:
+      return self._cached_multiplier
     return self._scale_number / tf.sinh(
         tf.asinh(self._scale_number) * tailweight)
 
@@ -26,6 +26,7 @@ import tensorflow.compat.v2 as tf
 from tensorflow_probability.python import bijectors as tfb
 from tensorflow_probability.python.bijectors import bijector_test_util
 from tensorflow_probability.python.internal import test_util
+from tensorflow_probability.python.math import value_and_gradient
 
 
 @test_util.test_all_tf_execution_regimes
@@ -192,6 +193,25 @@ class SinhArcsinhTest(test_util.TestCase):
     self.assertEqual(bijector.tailweight.dtype, np.float32)
     self.assertEqual(bijector.skewness.dtype, np.float32)
 
+  def testTensorTailweightGradient(self):
+    # The output multiplier 2 / F_0(2) is only precomputed for literal
+    # tailweights; a watched tensor tailweight must receive its full
+    # gradient, including the multiplier term.
+    x = np.float32(0.7)
+    skewness = np.float32(0.4)
+    _, grad = value_and_gradient(
+        lambda tw: tfb.SinhArcsinh(  # pylint: disable=g-long-lambda
+            skewness=skewness, tailweight=tw).forward(x),
+        tf.constant(1.3))
+
+    def forward(tw):
+      multiplier = 2. / np.sinh(np.arcsinh(2.) * tw)
+      return np.sinh((np.arcsinh(x) + skewness) * tw) * multiplier
+
+    h = 1e-3
+    numerical = (forward(1.3 + h) - forward(1.3 - h)) / (2. * h)
+    self.assertAllClose(numerical, self.evaluate(grad), rtol=1e-3, atol=1e-3)
+
   def testVariableTailweight(self):
     x = tf.Variable(1.)
     b = tfb.SinhArcsinh(tailweight=x, validate_args=True)
@@ -18,19 +18,26 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import functools
+
+import numpy as np
+
 import tensorflow.compat.v2 as tf
+from tensorflow_probability.python import math as tfp_math
+from tensorflow_probability.python.bijectors import bijector as bijector_lib
 from tensorflow_probability.python.bijectors import chain as chain_bijector
 from tensorflow_probability.python.bijectors import identity as identity_bijector
-from tensorflow_probability.python.bijectors import scale as scale_bijector
-from tensorflow_probability.python.bijectors import shift as shift_bijector
 from tensorflow_probability.python.bijectors import sinh_arcsinh as sinh_arcsinh_bijector
 from tensorflow_probability.python.bijectors import softplus as softplus_bijector
 from tensorflow_probability.python.distributions import normal
 from tensorflow_probability.python.distributions import transformed_distribution
+from tensorflow_probability.python.internal import assert_util
 from tensorflow_probability.python.internal import distribution_util
 from tensorflow_probability.python.internal import dtype_util
 from tensorflow_probability.python.internal import parameter_properties
+from tensorflow_probability.python.internal import prefer_static as ps
 from tensorflow_probability.python.internal import tensor_util
+from tensorflow_probability.python.internal import tensorshape_util
 
 __all__ = [
     'SinhArcsinh',
@@ -98,6 +105,15 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
                             = P[F(Z) <= F_0(2)]
                             = P[Z <= 2]  (if F = F_0).
   ```
+
+  #### Performance
+
+  When sampling small batches in a tight Python loop on CPU (e.g. per-step
+  reinforcement-learning rollouts), per-call TF op dispatch dominates the
+  actual math. For that pattern, consider the NumPy substrate of this
+  distribution, `tfp.substrates.numpy.distributions.SinhArcsinh`, which runs
+  the same sampling path on NumPy ufuncs without graph or op-dispatch
+  overhead.
   """
 
   def __init__(self,
@@ -106,6 +122,7 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
                skewness=None,
                tailweight=None,
                distribution=None,
+               dtype=None,
                validate_args=False,
                allow_nan_stats=True,
                name='SinhArcsinh'):
@@ -130,6 +147,11 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
         a `SinhArcsinh` sample and `distribution` is not
         `FULLY_REPARAMETERIZED` yet is a function of trainable variables, then
         the gradient will be incorrect!
+      dtype: `DType` for the parameters, overriding the dtype otherwise
+        inferred from `(loc, scale, skewness, tailweight)`. Useful to select
+        a reduced-precision dtype (e.g. `tf.bfloat16`) when parameters are
+        given as Python floats, which would otherwise default to `float32`.
+        Default value: `None` (i.e., infer the common dtype).
       validate_args: Python `bool`, default `False`. When `True` distribution
         parameters are checked for validity despite possibly degrading runtime
         performance. When `False` invalid inputs may silently render incorrect
@@ -142,20 +164,32 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
     """
     parameters = dict(locals())
 
-    with tf.name_scope(name) as name:
+    # Resolve parameter defaults and the common dtype up front; neither
+    # creates ops, so there is no need to hold the name scope open for them.
+    if dtype is None:
       dtype = dtype_util.common_dtype([loc, scale, skewness, tailweight],
                                       tf.float32)
-      self._loc = tensor_util.convert_nonref_to_tensor(
-          loc, name='loc', dtype=dtype)
-      self._scale = tensor_util.convert_nonref_to_tensor(
-          scale, name='scale', dtype=dtype)
-      tailweight = 1. if tailweight is None else tailweight
-      has_default_skewness = skewness is None
-      skewness = 0. if has_default_skewness else skewness
-      self._tailweight = tensor_util.convert_nonref_to_tensor(
-          tailweight, name='tailweight', dtype=dtype)
-      self._skewness = tensor_util.convert_nonref_to_tensor(
-          skewness, name='skewness', dtype=dtype)
+    has_default_tailweight = tailweight is None
+    tailweight = 1. if has_default_tailweight else tailweight
+    has_default_skewness = skewness is None
+    skewness = 0. if has_default_skewness else skewness
+
+    with tf.name_scope(name) as name:
+      self._loc, self._scale, self._tailweight, self._skewness = [
+          tensor_util.convert_nonref_to_tensor(
+              param, name=param_name, dtype=dtype)
+          for param, param_name in zip(
+              (loc, scale, tailweight, skewness),
+              ('loc', 'scale', 'tailweight', 'skewness'))]
+
+      # Parameter shapes are fixed after construction (ref parameters such as
+      # `tf.Variable`s cannot change shape), so the static batch shape can be
+      # computed once here rather than on every `batch_shape` query.
+      static_batch_shape = functools.reduce(
+          tf.broadcast_static_shape,
+          (self._skewness.shape, self._tailweight.shape, self._loc.shape,
+           self._scale.shape))
+      self._static_batch_shape = static_batch_shape
 
       # Recall, with Z a random variable,
       #   Y := loc + scale * F(Z),
@@ -163,28 +197,59 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
       #   C := 2 / F_0(2)
       #   F_0(Z) := Sinh( Arcsinh(Z) * tailweight )
       if distribution is None:
-        batch_rank = tf.reduce_max([
+        ranks = [
             distribution_util.prefer_static_rank(x)
             for x in (self._skewness, self._tailweight, self._loc, self._scale)
-        ])
+        ]
         # TODO(b/160730249): Make `loc` a scalar `0.` and remove overridden
         # `batch_shape` and `batch_shape_tensor` when
         # TransformedDistribution's bijector can modify its `batch_shape`.
+        # Until then `loc` must carry the full batch rank (all dimensions may
+        # be `1`, since the bijector broadcasts against the parameters), so
+        # build it as a numpy constant when the rank is static: this avoids
+        # dispatching any `tf.ones`/`tf.zeros` kernels at construction time.
+        if any(tf.is_tensor(r) for r in ranks):
+          loc0 = tf.zeros(tf.ones(tf.reduce_max(ranks), tf.int32), dtype=dtype)
+        else:
+          loc0 = np.zeros([1] * int(max(ranks)),
+                          dtype=dtype_util.as_numpy_dtype(dtype))
         distribution = normal.Normal(
-            loc=tf.zeros(tf.ones(batch_rank, tf.int32), dtype=dtype),
-            scale=tf.ones([], dtype=dtype),
+            loc=loc0,
+            scale=np.ones([], dtype=dtype_util.as_numpy_dtype(dtype)),
             allow_nan_stats=allow_nan_stats,
             validate_args=validate_args)
 
-      # Make the SAS bijector, 'F'.
-      f = sinh_arcsinh_bijector.SinhArcsinh(
-          skewness=self._skewness, tailweight=self._tailweight,
-          validate_args=validate_args)
+      # The fused bijector bakes parameter-derived constants in at
+      # construction, which is only tape-safe when no parameter can ever be
+      # watched or assigned, i.e. when all were given as Python/NumPy
+      # literals. Tensor and ref parameters take the chained construction,
+      # which reads them anew on every call.
+      has_literal_params = not any(
+          tf.is_tensor(p) or tensor_util.is_ref(p)
+          for p in (skewness, tailweight, loc, scale))
+      if has_default_skewness and has_default_tailweight:
+        # With `skewness = 0` and `tailweight = 1`, `F(Z) = Z`, so the SAS
+        # stage is the identity and only the affine transform remains; skip
+        # the sinh/arcsinh evaluations entirely.
+        bijector = _ShiftScale(
+            loc=self._loc, scale=self._scale, validate_args=validate_args)
+      elif has_literal_params:
+        # With literal parameters, the whole transformation
+        # Z --> loc + scale * F(Z) can be evaluated as one expression,
+        # avoiding the intermediate tensors a three-bijector chain would
+        # materialize between its stages.
+        bijector = _FusedSinhArcsinhAffine(
+            loc=self._loc, scale=self._scale, skewness=self._skewness,
+            tailweight=self._tailweight, validate_args=validate_args)
+      else:
+        # Make the SAS bijector, 'F'.
+        f = sinh_arcsinh_bijector.SinhArcsinh(
+            skewness=self._skewness, tailweight=self._tailweight,
+            validate_args=validate_args)
 
-      # Make the AffineScalar bijector, Z --> loc + scale * Z (2 / F_0(2))
-      affine = shift_bijector.Shift(shift=self._loc)(
-          scale_bijector.Scale(scale=self._scale))
-      bijector = chain_bijector.Chain([affine, f])
+        # Make the affine bijector, Z --> loc + scale * Z (2 / F_0(2))
+        affine = _ShiftScale(loc=self._loc, scale=self._scale)
+        bijector = chain_bijector.Chain([affine, f])
 
       super(SinhArcsinh, self).__init__(
           distribution=distribution,
@@ -195,15 +260,14 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
 
   @classmethod
   def _parameter_properties(cls, dtype, num_classes=None):
+    softplus_fn = _positive_softplus_fn(dtype)
     return dict(
         loc=parameter_properties.ParameterProperties(),
         scale=parameter_properties.ParameterProperties(
-            default_constraining_bijector_fn=(
-                lambda: softplus_bijector.Softplus(low=dtype_util.eps(dtype)))),
+            default_constraining_bijector_fn=softplus_fn),
         skewness=parameter_properties.ParameterProperties(),
         tailweight=parameter_properties.ParameterProperties(
-            default_constraining_bijector_fn=(
-                lambda: softplus_bijector.Softplus(low=dtype_util.eps(dtype)))))
+            default_constraining_bijector_fn=softplus_fn))
 
   @property
   def loc(self):
@@ -228,16 +292,274 @@ class SinhArcsinh(transformed_distribution.TransformedDistribution):
   experimental_is_sharded = False
 
   def _batch_shape(self):
-    params = [self.skewness, self.tailweight, self.loc, self.scale]
-    s_shape = params[0].shape
-    for t in params[1:]:
-      s_shape = tf.broadcast_static_shape(s_shape, t.shape)
-    return s_shape
+    return self._static_batch_shape
 
   def _batch_shape_tensor(self):
-    return distribution_util.get_broadcast_shape(
-        self.skewness, self.tailweight, self.loc, self.scale)
+    # Only reached when the static batch shape is not fully defined — the
+    # base class serves fully-defined shapes from `batch_shape` directly.
+    # Use `ps` so that statically-known parameter shapes are broadcast
+    # host-side without dispatching any ops.
+    return functools.reduce(
+        ps.broadcast_shape,
+        [ps.shape(p)
+         for p in (self.skewness, self.tailweight, self.loc, self.scale)])
+
+  def _log_prob(self, y, **kwargs):
+    # Fast path: with literal parameters the bijector is the fused affine +
+    # SAS transform, whose inverse and inverse log-det-Jacobian share their
+    # intermediates. Computing both in one pass avoids
+    # TransformedDistribution's generic bijector walk, which evaluates them
+    # separately. The elementwise ILDJ is only valid as-is for a scalar-event
+    # base distribution; non-scalar events (e.g. a user-supplied
+    # `Independent` base) need the event-dim reduction the generic path
+    # performs, so fall through in that case.
+    if (isinstance(self.bijector, _FusedSinhArcsinhAffine) and
+        tensorshape_util.rank(self.distribution.event_shape) == 0):
+      distribution_kwargs, _ = self._kwargs_split_fn(kwargs)
+      x, ildj = self.bijector._inverse_and_inverse_log_det_jacobian(y)  # pylint: disable=protected-access
+      base_log_prob = self.distribution.log_prob(x, **distribution_kwargs)
+      return base_log_prob + tf.cast(ildj, base_log_prob.dtype)
+    return super(SinhArcsinh, self)._log_prob(y, **kwargs)
 
   def _default_event_space_bijector(self):
     # TODO(b/145620027) Finalize choice of bijector.
-    return identity_bijector.Identity(validate_args=self.validate_args)
+    return _identity_bijector(self.validate_args)
+
+
+@functools.lru_cache(maxsize=8)
+def _positive_softplus_fn(dtype):
+  """Returns a constraining-bijector factory for positive parameters.
+
+  The factory itself (and the `eps` lookup it closes over) is memoized per
+  `dtype`, so repeated `parameter_properties` queries do not rebuild
+  identical closures. The `Softplus` bijector is still constructed lazily by
+  the factory, since it holds a tensor that must live in the caller's graph.
+
+  Args:
+    dtype: `DType` of the constrained parameter.
+
+  Returns:
+    softplus_fn: Zero-argument callable returning a
+      `Softplus(low=eps(dtype))` bijector.
+  """
+  eps = dtype_util.eps(dtype)
+  return lambda: softplus_bijector.Softplus(low=eps)
+
+
+@functools.lru_cache(maxsize=2)
+def _identity_bijector(validate_args):
+  """Returns a shared `Identity` bijector instance.
+
+  `Identity` is stateless and parameterless (it creates no tensors), so the
+  same instance can be shared by every distribution rather than allocating a
+  fresh bijector each time the default event space bijector is requested.
+
+  Args:
+    validate_args: Python `bool` passed to the `Identity` constructor.
+
+  Returns:
+    identity: An `Identity` bijector, memoized on `validate_args`.
+  """
+  return identity_bijector.Identity(validate_args=validate_args)
+
+
+class _ShiftScale(bijector_lib.Bijector):
+  """Computes `Y = loc + scale * X` as a single elementwise stage.
+
+  Equivalent to `Chain([Shift(loc), Scale(scale)])` but applies the affine
+  transform in one pass instead of two chained bijectors, each of which
+  reads and writes a full tensor. Parameters may be ref types (e.g.
+  `tf.Variable`s); they are read anew on each call.
+  """
+
+  def __init__(self, loc, scale, validate_args=False, name='shift_scale'):
+    parameters = dict(locals())
+    with tf.name_scope(name) as name:
+      dtype = dtype_util.common_dtype([loc, scale], tf.float32)
+      self._loc = tensor_util.convert_nonref_to_tensor(
+          loc, dtype=dtype, name='loc')
+      self._scale = tensor_util.convert_nonref_to_tensor(
+          scale, dtype=dtype, name='scale')
+      super(_ShiftScale, self).__init__(
+          forward_min_event_ndims=0,
+          is_constant_jacobian=True,
+          validate_args=validate_args,
+          dtype=dtype,
+          parameters=parameters,
+          name=name)
+
+  def _is_increasing(self):
+    return self._scale > 0
+
+  def _forward(self, x):
+    return self._loc + self._scale * x
+
+  def _inverse(self, y):
+    return (y - self._loc) / self._scale
+
+  def _forward_log_det_jacobian(self, x):
+    return tf.math.log(tf.abs(self._scale))
+
+  def _parameter_control_dependencies(self, is_init):
+    if not self.validate_args:
+      return []
+    assertions = []
+    if is_init != tensor_util.is_ref(self._scale):
+      assertions.append(
+          assert_util.assert_none_equal(
+              self._scale,
+              tf.zeros([], dtype=self._scale.dtype),
+              message='Argument `scale` must be non-zero.'))
+    return assertions
+
+
+class _FusedSinhArcsinhAffine(bijector_lib.Bijector):
+  """Computes `Y = loc + scale * F(X)` as a single fused expression.
+
+  This is equivalent to
+  `Chain([Shift(loc), Scale(scale), SinhArcsinh(skewness, tailweight)])`
+  but evaluates the composite transformation in one pass instead of
+  dispatching three elementwise stages, each of which reads and writes a
+  full intermediate tensor. It is used internally by `SinhArcsinh` only when
+  all four parameters are Python/NumPy literals: derived constants are baked
+  in at construction, which would break the gradient-tape contract for
+  watched tensor parameters and miss updates to ref parameters.
+  """
+
+  def __init__(self,
+               loc,
+               scale,
+               skewness,
+               tailweight,
+               validate_args=False,
+               name='fused_sinh_arcsinh_affine'):
+    parameters = dict(locals())
+    with tf.name_scope(name) as name:
+      dtype = dtype_util.common_dtype([loc, scale, skewness, tailweight],
+                                      tf.float32)
+      self._loc = tf.convert_to_tensor(loc, dtype=dtype, name='loc')
+      self._scale = tf.convert_to_tensor(scale, dtype=dtype, name='scale')
+      self._skewness = tf.convert_to_tensor(
+          skewness, dtype=dtype, name='skewness')
+      self._tailweight = tf.convert_to_tensor(
+          tailweight, dtype=dtype, name='tailweight')
+      # float16/bfloat16 sinh/asinh lose precision quickly, so for those
+      # dtypes run the transform's interior in float32 and cast back at the
+      # output boundary; the reduced-precision dtype is kept for storage and
+      # I/O only. The casts are elementwise and fuse away under XLA.
+      # Compare dtype names rather than `tf.bfloat16` directly: the numpy
+      # substrate does not define a bfloat16 dtype.
+      self._use_float32_compute = dtype_util.name(
+          dtype_util.base_dtype(dtype)) in ('float16', 'bfloat16')
+      if self._use_float32_compute:
+        self._loc, self._scale, self._skewness, self._tailweight = [
+            tf.cast(p, tf.float32)
+            for p in (self._loc, self._scale, self._skewness,
+                      self._tailweight)]
+      # C = 2 / F_0(2), fixed at construction since `tailweight` is a
+      # literal.
+      two = tf.convert_to_tensor(2., dtype=self._tailweight.dtype)
+      self._multiplier = two / tf.sinh(tf.asinh(two) * self._tailweight)
+      # Derived constants shared by the forward, inverse, and
+      # log-det-Jacobian paths, also fixed at construction. The reciprocals
+      # let the per-element expressions multiply instead of divide.
+      self._scale_multiplier = self._scale * self._multiplier
+      self._inv_scale_multiplier = tf.math.reciprocal(self._scale_multiplier)
+      self._inv_tailweight = tf.math.reciprocal(self._tailweight)
+      self._log_scale_tailweight_multiplier = tf.math.log(
+          tf.abs(self._scale) * self._tailweight * self._multiplier)
+      super(_FusedSinhArcsinhAffine, self).__init__(
+          forward_min_event_ndims=0,
+          validate_args=validate_args,
+          dtype=dtype,
+          parameters=parameters,
+          name=name)
+
+  def _is_increasing(self):
+    return self._scale > 0
+
+  def _forward(self, x):
+    if self._use_float32_compute:
+      x = tf.cast(x, tf.float32)
+    y = self._loc + self._scale_multiplier * tf.sinh(
+        (tf.asinh(x) + self._skewness) * self._tailweight)
+    return tf.cast(y, self.dtype) if self._use_float32_compute else y
+
+  def _inverse(self, y):
+    if self._use_float32_compute:
+      y = tf.cast(y, tf.float32)
+    u = (y - self._loc) * self._inv_scale_multiplier
+    x = tf.sinh(tf.asinh(u) * self._inv_tailweight - self._skewness)
+    return tf.cast(x, self.dtype) if self._use_float32_compute else x
+
+  def _inverse_log_det_jacobian(self, y):
+    # x = sinh(arcsinh((y - loc) / (scale * C)) / tailweight - skewness)
+    # Using sinh' = cosh, arcsinh'(y) = 1 / sqrt(y**2 + 1),
+    # dx/dy
+    # = cosh(arcsinh(u) / tailweight - skewness)
+    #     / (tailweight * sqrt(u**2 + 1) * scale * C),  u = (y - loc)/(scale*C)
+    if self._use_float32_compute:
+      y = tf.cast(y, tf.float32)
+    u = (y - self._loc) * self._inv_scale_multiplier
+    ildj = (tfp_math.log_cosh(tf.asinh(u) * self._inv_tailweight -
+                              self._skewness) -
+            0.5 * tfp_math.log1psquare(u) -
+            self._log_scale_tailweight_multiplier)
+    return tf.cast(ildj, self.dtype) if self._use_float32_compute else ildj
+
+  def _inverse_and_inverse_log_det_jacobian(self, y):
+    """Computes `inverse(y)` and its log-det-Jacobian in a single pass.
+
+    The two quantities share the `asinh((y - loc) / (scale * C))`
+    intermediates, so evaluating them jointly is cheaper than separate
+    `inverse` and `inverse_log_det_jacobian` calls.
+
+    Args:
+      y: `Tensor` of values to invert.
+
+    Returns:
+      x: `Tensor`, the image of `y` under `inverse`.
+      ildj: `Tensor`, the inverse log-det-Jacobian at `y` (`event_ndims=0`).
+    """
+    if self._use_float32_compute:
+      y = tf.cast(y, tf.float32)
+    u = (y - self._loc) * self._inv_scale_multiplier
+    v = tf.asinh(u) * self._inv_tailweight - self._skewness
+    # Using cosh(v) = sqrt(1 + sinh(v)**2), this matches -fldj(sinh(v)).
+    ildj = (tfp_math.log_cosh(v) -
+            0.5 * tfp_math.log1psquare(u) -
+            self._log_scale_tailweight_multiplier)
+    x = tf.sinh(v)
+    if self._use_float32_compute:
+      x = tf.cast(x, self.dtype)
+      ildj = tf.cast(ildj, self.dtype)
+    return x, ildj
+
+  def _forward_log_det_jacobian(self, x):
+    # y = loc + scale * multiplier * sinh((arcsinh(x) + skewness) * tailweight)
+    # Using sinh' = cosh, arcsinh'(x) = 1 / sqrt(x**2 + 1),
+    # dy/dx
+    # = scale * multiplier * cosh((arcsinh(x) + skewness) * tailweight)
+    #     * tailweight / sqrt(x**2 + 1)
+    if self._use_float32_compute:
+      x = tf.cast(x, tf.float32)
+    fldj = (tfp_math.log_cosh((tf.asinh(x) + self._skewness) *
+                              self._tailweight) -
+            0.5 * tfp_math.log1psquare(x) +
+            self._log_scale_tailweight_multiplier)
+    return tf.cast(fldj, self.dtype) if self._use_float32_compute else fldj
+
+  def _parameter_control_dependencies(self, is_init):
+    if not self.validate_args or not is_init:
+      # All parameters are non-ref tensors, so assertions are only needed at
+      # construction time.
+      return []
+    return [
+        assert_util.assert_positive(
+            self._tailweight,
+            message='Argument `tailweight` must be positive.'),
+        assert_util.assert_none_equal(
+            self._scale,
+            tf.zeros([], dtype=self._scale.dtype),
+            message='Argument `scale` must be non-zero.'),
+    ]
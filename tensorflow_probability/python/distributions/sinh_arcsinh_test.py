@@ -25,6 +25,7 @@ import tensorflow.compat.v1 as tf1
 import tensorflow.compat.v2 as tf
 import tensorflow_probability as tfp
 
+from tensorflow_probability.python.distributions import sinh_arcsinh as sinh_arcsinh_lib
 from tensorflow_probability.python.internal import test_util
 
 tfd = tfp.distributions
@@ -213,6 +214,135 @@ class SinhArcsinhTest(test_util.TestCase):
     self.assertLen(grads, 2)
     self.assertAllNotNone(grads)
 
+  def testFusedAndChainedBijectorsAgree(self):
+    # Python-literal parameters select the fused single-pass bijector;
+    # tensor parameters select the chained construction. The two must be
+    # numerically interchangeable.
+    loc, scale, skewness, tailweight = 0.4, 2.1, -0.7, 1.6
+    fused = tfd.SinhArcsinh(
+        loc=loc, scale=scale, skewness=skewness, tailweight=tailweight,
+        validate_args=True)
+    chained = tfd.SinhArcsinh(
+        loc=tf.constant(loc), scale=tf.constant(scale),
+        skewness=tf.constant(skewness), tailweight=tf.constant(tailweight),
+        validate_args=True)
+    self.assertIsInstance(
+        fused.bijector, sinh_arcsinh_lib._FusedSinhArcsinhAffine)
+    self.assertNotIsInstance(
+        chained.bijector, sinh_arcsinh_lib._FusedSinhArcsinhAffine)
+
+    x = np.linspace(-5., 5., 20).astype(np.float32)
+    self.assertAllClose(
+        self.evaluate(chained.bijector.forward(x)),
+        self.evaluate(fused.bijector.forward(x)))
+    self.assertAllClose(
+        self.evaluate(chained.bijector.inverse(x)),
+        self.evaluate(fused.bijector.inverse(x)))
+    self.assertAllClose(
+        self.evaluate(chained.bijector.inverse_log_det_jacobian(
+            x, event_ndims=0)),
+        self.evaluate(fused.bijector.inverse_log_det_jacobian(
+            x, event_ndims=0)),
+        rtol=1e-5)
+    self.assertAllClose(
+        self.evaluate(chained.log_prob(x)),
+        self.evaluate(fused.log_prob(x)),
+        rtol=1e-5)
+
+  def testDefaultParamsSkipSASStage(self):
+    # With default skewness/tailweight the transformation is exactly affine,
+    # so the SAS stage is skipped; results must match the explicit
+    # skewness=0, tailweight=1 parameterization.
+    b = 10
+    scale = rng.rand(b) + 0.5
+    loc = rng.randn(b)
+    sasnorm = tfd.SinhArcsinh(loc=loc, scale=scale, validate_args=True)
+    self.assertIsInstance(sasnorm.bijector, sinh_arcsinh_lib._ShiftScale)
+
+    explicit = tfd.SinhArcsinh(
+        loc=loc, scale=scale, skewness=0., tailweight=1., validate_args=True)
+    x = rng.randn(5, b)
+    self.assertAllClose(
+        self.evaluate(explicit.log_prob(x)),
+        self.evaluate(sasnorm.log_prob(x)))
+
+  def testNonScalarEventBaseDistribution(self):
+    # A non-scalar-event base distribution must route through the generic
+    # TransformedDistribution log_prob; the fused fast path is scalar-event
+    # only.
+    base = tfd.Independent(
+        tfd.Normal(loc=tf.zeros([3]), scale=1., validate_args=True),
+        reinterpreted_batch_ndims=1, validate_args=True)
+    sasind = tfd.SinhArcsinh(
+        loc=0.5, scale=2., skewness=0.5, tailweight=1.2,
+        distribution=base, validate_args=True)
+    x = np.float32(rng.randn(2, 3))
+    lp = self.evaluate(sasind.log_prob(x))
+    self.assertAllEqual((2,), lp.shape)
+
+    chained = tfd.SinhArcsinh(
+        loc=tf.constant(0.5), scale=tf.constant(2.),
+        skewness=tf.constant(0.5), tailweight=tf.constant(1.2),
+        distribution=base, validate_args=True)
+    self.assertAllClose(self.evaluate(chained.log_prob(x)), lp, rtol=1e-5)
+
+  def testExplicitDtype(self):
+    sas16 = tfd.SinhArcsinh(
+        loc=0., scale=1., skewness=0.3, tailweight=1.2, dtype=tf.float16)
+    self.assertEqual(tf.float16, sas16.dtype)
+    samps = self.evaluate(sas16.sample(10, seed=test_util.test_seed()))
+    self.assertEqual(np.float16, samps.dtype)
+    lp = self.evaluate(sas16.log_prob(np.float16(0.5)))
+    self.assertEqual(np.float16, lp.dtype)
+    self.assertAllFinite(lp)
+    # The half-precision path computes its interior in float32, so results
+    # should match the float32 distribution to half precision.
+    sas32 = tfd.SinhArcsinh(loc=0., scale=1., skewness=0.3, tailweight=1.2)
+    self.assertAllClose(self.evaluate(sas32.log_prob(0.5)), lp, atol=1e-2)
+
+  @test_util.tf_tape_safety_test
+  def testNonVariableGradientsNonDefaultParams(self):
+    # Non-default skewness/tailweight exercise the SAS stage; gradients must
+    # flow to all four watched tensor parameters, including through the
+    # 2 / F_0(2) multiplier term.
+    loc = tf.convert_to_tensor(0.4)
+    scale = tf.convert_to_tensor(2.1)
+    skewness = tf.convert_to_tensor(-0.7)
+    tailweight = tf.convert_to_tensor(1.6)
+    sasnorm = tfd.SinhArcsinh(
+        loc=loc, scale=scale, skewness=skewness, tailweight=tailweight,
+        validate_args=True)
+
+    with tf.GradientTape() as tape:
+      tape.watch([loc, scale, skewness, tailweight])
+      y = sasnorm.log_prob(0.7)
+    grads = tape.gradient(y, [loc, scale, skewness, tailweight])
+    self.assertLen(grads, 4)
+    self.assertAllNotNone(grads)
+
+    # Compare the tailweight gradient against a finite difference; this
+    # catches parameter-derived constants wrongly frozen at construction.
+    h = 1e-3
+    lp = lambda tw: tfd.SinhArcsinh(  # pylint: disable=g-long-lambda
+        loc=0.4, scale=2.1, skewness=-0.7, tailweight=tw).log_prob(0.7)
+    numerical = self.evaluate((lp(1.6 + h) - lp(1.6 - h)) / (2. * h))
+    self.assertAllClose(numerical, self.evaluate(grads[3]),
+                        rtol=1e-3, atol=1e-3)
+
+  @test_util.tf_tape_safety_test
+  def testVariableGradientsNonDefaultParams(self):
+    scale = tf.Variable(2.1)
+    tailweight = tf.Variable(1.6)
+    sasnorm = tfd.SinhArcsinh(
+        loc=0.4, scale=scale, skewness=-0.7, tailweight=tailweight,
+        validate_args=True)
+
+    with tf.GradientTape() as tape:
+      y = sasnorm.log_prob(0.7)
+    grads = tape.gradient(y, sasnorm.trainable_variables)
+    self.assertLen(grads, 2)
+    self.assertAllNotNone(grads)
+
 
 if __name__ == '__main__':
   tf.test.main()